@@ -19,6 +19,11 @@ class Conn():
         """
         return None
 
+    def flush(self):
+        """Return and clear already received data
+        """
+        return b''
+
     def read(self):
         """Read available data from device
         """
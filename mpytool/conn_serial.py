@@ -56,18 +56,21 @@ class ConnSerial(_conn.Conn):
         if self._log:
             self._log.debug("wait for %s", end)
         start_time = _time.time()
+        search_from = 0
         while True:
             if self._read_to_buffer():
                 start_time = _time.time()
-            if end in self._buffer:
+            index = self._buffer.find(end, search_from)
+            if index >= 0:
                 break
+            # next time search only in newly received data
+            search_from = max(0, len(self._buffer) - len(end) + 1)
             if timeout is not None and start_time + timeout < _time.time():
                 if self._buffer:
                     raise _conn.Timeout(
                         f"During timeout received: {bytes(self._buffer)}")
                 raise _conn.Timeout("No data received")
             _time.sleep(.01)
-        index = self._buffer.index(end)
         data = self._buffer[:index]
         del self._buffer[:index + len(end)]
         if self._log:
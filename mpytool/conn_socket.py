@@ -68,17 +68,20 @@ class ConnSocket(_conn.Conn):
         if self._log:
             self._log.debug("wait for %s", end)
         start_time = _time.time()
+        search_from = 0
         while True:
             self._buffer += self._socket.recv(4096)
-            if end in self._buffer:
+            index = self._buffer.find(end, search_from)
+            if index >= 0:
                 break
+            # next time search only in newly received data
+            search_from = max(0, len(self._buffer) - len(end) + 1)
             if timeout is not None and start_time + timeout < _time.time():
                 if self._buffer:
                     raise _conn.Timeout(
                         f"During timeout received: {bytes(self._buffer)}")
                 raise _conn.Timeout("No data received")
             _time.sleep(.01)
-        index = self._buffer.index(end)
         data = self._buffer[:index]
         del self._buffer[:index + len(end)]
         if self._log:
@@ -3,6 +3,17 @@
 import mpytool.mpy_comm as _mpy_comm
 
 
+_ESCAPE_TABLE = str.maketrans({'\\': '\\\\', "'": "\\'"})
+
+
+def _escape_path(path):
+    """Escape path for use in single quoted MicroPython string
+    """
+    if "'" not in path and '\\' not in path:
+        return path
+    return path.translate(_ESCAPE_TABLE)
+
+
 class PathNotFound(_mpy_comm.MpyError):
     """File not found"""
     def __init__(self, file_name):
@@ -38,7 +49,7 @@ def _mpytool_stat(path):
             return -1
         if res[0] == {_ATTR_FILE}:
             return res[6]
-    except:
+    except OSError:
         return None
     return None
 """,
@@ -65,11 +76,12 @@ def _mpytool_tree(path):
 """,
         'mkdir': f"""
 def _mpytool_mkdir(path):
-    path = path.rstrip('/')
-    check_path = ''
+    check_path = '/' if path.startswith('/') else ''
     found = True
     for dir_part in path.split('/'):
-        if check_path:
+        if not dir_part:
+            continue
+        if check_path and check_path != '/':
             check_path += '/'
         check_path += dir_part
         if found:
@@ -78,7 +90,7 @@ def _mpytool_mkdir(path):
                 if result[0] == {_ATTR_FILE}:
                     return True
                 continue
-            except:
+            except OSError:
                 found = False
         os.mkdir(check_path)
     return False
@@ -97,8 +109,8 @@ def _mpytool_rmdir(path):
         self._conn = conn
         self._log = log
         self._mpy_comm = _mpy_comm.MpyComm(conn, log=log)
-        self._imported = []
-        self._load_helpers = []
+        self._imported = set()
+        self._load_helpers = set()
 
     @property
     def conn(self):
@@ -112,6 +124,13 @@ def _mpytool_rmdir(path):
         """
         return self._mpy_comm
 
+    def soft_reset(self):
+        """Soft reset device, loaded helpers and imports are lost
+        """
+        self._mpy_comm.soft_reset()
+        self._imported.clear()
+        self._load_helpers.clear()
+
     def load_helper(self, helper):
         """Load helper function to MicroPython
 
@@ -122,7 +141,7 @@ def _mpytool_rmdir(path):
             if helper not in self._HELPERS:
                 raise _mpy_comm.MpyError(f'Helper {helper} not defined')
             self._mpy_comm.exec(self._HELPERS[helper])
-            self._load_helpers.append(helper)
+            self._load_helpers.add(helper)
 
     def import_module(self, module):
         """Import module to MicroPython
@@ -132,7 +151,7 @@ def _mpytool_rmdir(path):
         """
         if module not in self._imported:
             self._mpy_comm.exec(f'import {module}')
-            self._imported.append(module)
+            self._imported.add(module)
 
     def stat(self, path):
         """Stat path
@@ -147,7 +166,8 @@ def _mpytool_rmdir(path):
         """
         self.import_module('os')
         self.load_helper('stat')
-        return self._mpy_comm.exec_eval(f"_mpytool_stat('{path}')")
+        return self._mpy_comm.exec_eval(
+            f"_mpytool_stat('{_escape_path(path)}')")
 
     def ls(self, path=None):
         """List files on path
@@ -166,7 +186,7 @@ def _mpytool_rmdir(path):
             path = ''
         try:
             result = self._mpy_comm.exec_eval(
-                f"tuple(os.ilistdir('{path}'))")
+                f"tuple(os.ilistdir('{_escape_path(path)}'))")
             res_dir = []
             res_file = []
             for entry in result:
@@ -199,14 +219,16 @@ def _mpytool_rmdir(path):
         if path is None:
             path = ''
         if path in ('', '.', '/'):
-            return self._mpy_comm.exec_eval(f"_mpytool_tree('{path}')")
+            return self._mpy_comm.exec_eval(
+                f"_mpytool_tree('{_escape_path(path)}')")
         # check if path exists
         result = self.stat(path)
         if result is None:
             raise DirNotFound(path)
         if result == -1:
-            return self._mpy_comm.exec_eval(f"_mpytool_tree('{path}')")
-        return((path, result[6], None))
+            return self._mpy_comm.exec_eval(
+                f"_mpytool_tree('{_escape_path(path)}')")
+        return (path, result, None)
 
     def mkdir(self, path):
         """make directory (also create all parents)
@@ -216,7 +238,8 @@ def _mpytool_rmdir(path):
         """
         self.import_module('os')
         self.load_helper('mkdir')
-        if self._mpy_comm.exec_eval(f"_mpytool_mkdir('{path}')"):
+        if self._mpy_comm.exec_eval(
+                f"_mpytool_mkdir('{_escape_path(path)}')"):
             raise _mpy_comm.MpyError(f'Error creating directory, this is file: {path}')
 
     def delete(self, path):
@@ -231,9 +254,10 @@ def _mpytool_rmdir(path):
         if result == -1:
             self.import_module('os')
             self.load_helper('rmdir')
-            self._mpy_comm.exec(f"_mpytool_rmdir('{path}')", 20)
+            self._mpy_comm.exec(
+                f"_mpytool_rmdir('{_escape_path(path)}')", 20)
         else:
-            self._mpy_comm.exec(f"os.remove('{path}')")
+            self._mpy_comm.exec(f"os.remove('{_escape_path(path)}')")
 
     def get(self, path):
         """Read file
@@ -244,29 +268,34 @@ def _mpytool_rmdir(path):
         Returns:
             bytes with file content
         """
+        comm = self._mpy_comm
         try:
-            self._mpy_comm.exec(f"f = open('{path}', 'rb')")
+            comm.exec(f"f = open('{_escape_path(path)}', 'rb')")
         except _mpy_comm.CmdError as err:
             raise FileNotFound(path) from err
-        data = b''
+        read_cmd = f"f.read({self._CHUNK})"
+        data = bytearray()
         while True:
-            result = self._mpy_comm.exec_eval(f"f.read({self._CHUNK})")
+            result = comm.exec_eval(read_cmd)
             if not result:
                 break
             data += result
-        self._mpy_comm.exec("f.close()")
-        return data
+        comm.exec("f.close()")
+        return bytes(data)
 
     def put(self, data, path):
         """Read file
 
         Arguments:
-            data: bytes with file content
+            data: bytes-like object with file content
             path: file path to write
         """
-        self._mpy_comm.exec(f"f = open('{path}', 'wb')")
-        while data:
-            chunk = data[:self._CHUNK]
-            count = self._mpy_comm.exec_eval(f"f.write({chunk})", timeout=10)
-            data = data[count:]
-        self._mpy_comm.exec("f.close()")
+        comm = self._mpy_comm
+        comm.exec(f"f = open('{_escape_path(path)}', 'wb')")
+        data = memoryview(data).cast('B')
+        offset = 0
+        while offset < len(data):
+            chunk = bytes(data[offset:offset + self._CHUNK])
+            count = comm.exec_eval(f"f.write({chunk})", timeout=10)
+            offset += count
+        comm.exec("f.close()")
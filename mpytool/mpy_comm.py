@@ -37,6 +37,9 @@ class CmdError(MpyError):
 
 
 class MpyComm():
+    _STOP_TIMEOUT = .2
+    _STOP_TIMEOUT_MAX = 2
+
     def __init__(self, conn, log=None):
         self._conn = conn
         self._log = log
@@ -46,7 +49,7 @@ class MpyComm():
     def conn(self):
         return self._conn
 
-    def stop_current_operation(self):
+    def stop_current_operation(self, timeout=1):
         if self._repl_mode is not None:
             return True
         if self._log:
@@ -54,21 +57,31 @@ class MpyComm():
         self._conn.write(b'\x03')
         try:
             # wait for prompt
-            self._conn.read_until(b'\r\n>>> ', timeout=1)
+            self._conn.read_until(b'\r\n>>> ', timeout=timeout)
         except _conn.Timeout:
-            # probably is in RAW repl
+            # probably is in RAW repl, exit it directly,
+            # repl mode is not known yet so exit_raw_repl() will not do it
             if self._log:
                 self._log.warning("Timeout while stopping program")
-            self.exit_raw_repl()
+            self._conn.write(b'\x02')
+            try:
+                self._conn.read_until(b'\r\n>>> ', timeout=timeout)
+            except _conn.Timeout:
+                pass
             return False
         return True
 
     def enter_raw_repl(self):
         if self._repl_mode is True:
             return
-        while not self.stop_current_operation():
+        if self._repl_mode is None:
+            # drop old data, so stale prompt will not be matched
+            self._conn.flush()
+        timeout = self._STOP_TIMEOUT
+        while not self.stop_current_operation(timeout):
             if self._log:
                 self._log.warning('..retry')
+            timeout = min(timeout * 2, self._STOP_TIMEOUT_MAX)
         if self._log:
             self._log.info('ENTER RAW REPL')
         self._conn.write(b'\x01')
@@ -110,8 +123,7 @@ class MpyComm():
         self.enter_raw_repl()
         if self._log:
             self._log.info("CMD: %s", command)
-        self._conn.write(bytes(command, 'utf-8'))
-        self._conn.write(b'\x04')
+        self._conn.write(bytes(command, 'utf-8') + b'\x04')
         self._conn.read_until(b'OK', timeout)
         result = self._conn.read_until(b'\x04', timeout)
         if result:
@@ -2,6 +2,8 @@
 
 import os as _os
 import sys as _sys
+import stat as _stat
+import posixpath as _posixpath
 import argparse as _argparse
 import logging as _logging
 import mpytool as _mpytool
@@ -116,23 +118,26 @@ class MpyTool():
     def _put_dir(self, src_path, dst_path):
         basename = _os.path.basename(src_path)
         if basename:
-            dst_path = _os.path.join(dst_path, basename)
+            dst_path = _posixpath.join(dst_path, basename)
         self.verbose(f"PUT_DIR: {src_path} -> {dst_path}")
+        src_root_len = len(_os.path.join(src_path, ''))
         for path, dirs, files in _os.walk(src_path, topdown=True):
             dirs[:] = [d for d in dirs if d not in self._exclude_dirs]
             basename = _os.path.basename(path)
             if basename in self._exclude_dirs:
                 continue
-            rel_path = _os.path.relpath(path, src_path)
-            if rel_path == '.':
-                rel_path = ''
-            rel_path = _os.path.join(dst_path, rel_path)
+            # paths on device are always separated by '/'
+            rel_path = path[src_root_len:].replace(_os.sep, '/')
+            rel_path = _posixpath.join(dst_path, rel_path)
             if rel_path:
                 self.verbose(f'mkdir: {rel_path}', 2)
                 self._mpy.mkdir(rel_path)
+            # prefixes are same for all files in this directory
+            src_prefix = _os.path.join(path, '')
+            dst_prefix = _posixpath.join(rel_path, '')
             for file_name in files:
-                spath = _os.path.join(path, file_name)
-                dpath = _os.path.join(rel_path, file_name)
+                spath = src_prefix + file_name
+                dpath = dst_prefix + file_name
                 self.verbose(f"  {dpath}")
                 with open(spath, 'rb') as src_file:
                     data = src_file.read()
@@ -140,24 +145,26 @@ class MpyTool():
 
     def _put_file(self, src_path, dst_path):
         basename = _os.path.basename(src_path)
-        if basename and not _os.path.basename(dst_path):
-            dst_path = _os.path.join(dst_path, basename)
+        if basename and not _posixpath.basename(dst_path):
+            dst_path = _posixpath.join(dst_path, basename)
         self.verbose(f"PUT_FILE: {src_path} -> {dst_path}")
-        path = _os.path.dirname(dst_path)
-        result = self._mpy.stat(path)
-        if result is None:
+        path = _posixpath.dirname(dst_path)
+        # root or current directory always exists
+        if path not in ('', '.', '/'):
+            # mkdir passes on existing directory and fails on file in path
             self._mpy.mkdir(path)
-        elif result >= 0:
-            raise _mpytool.MpyError(
-                f'Error creating file under file: {path}')
         with open(src_path, 'rb') as src_file:
             data = src_file.read()
             self._mpy.put(data, dst_path)
 
     def cmd_put(self, src_path, dst_path):
-        if _os.path.isdir(src_path):
+        try:
+            mode = _os.stat(src_path).st_mode
+        except OSError:
+            mode = 0
+        if _stat.S_ISDIR(mode):
             self._put_dir(src_path, dst_path)
-        elif _os.path.isfile(src_path):
+        elif _stat.S_ISREG(mode):
             self._put_file(src_path, dst_path)
         else:
             raise ParamsError(f'No file or directory to upload: {src_path}')
@@ -195,26 +202,25 @@ class MpyTool():
         if self._log:
             self._log.info(' Exiting..')
 
+    @staticmethod
+    def _pop_dir_name(commands):
+        """Pop optional directory argument, default is current directory
+        """
+        if not commands:
+            return '.'
+        dir_name = commands.pop(0)
+        if dir_name != '/':
+            dir_name = dir_name.rstrip('/')
+        return dir_name
+
     def process_commands(self, commands):
         try:
             while commands:
                 command = commands.pop(0)
                 if command in ('ls', 'dir'):
-                    if commands:
-                        dir_name = commands.pop(0)
-                        if dir_name != '/':
-                            dir_name = dir_name.rstrip('/')
-                        self.cmd_ls(dir_name)
-                        continue
-                    self.cmd_ls('.')
+                    self.cmd_ls(self._pop_dir_name(commands))
                 elif command == 'tree':
-                    if commands:
-                        dir_name = commands.pop(0)
-                        if dir_name != '/':
-                            dir_name = dir_name.rstrip('/')
-                        self.cmd_tree(dir_name)
-                        continue
-                    self.cmd_tree('.')
+                    self.cmd_tree(self._pop_dir_name(commands))
                 elif command in ('get', 'cat'):
                     if commands:
                         self.cmd_get(*commands)
@@ -236,7 +242,7 @@ class MpyTool():
                     self.cmd_delete(*commands)
                     break
                 elif command == 'reset':
-                    self._mpy.comm.soft_reset()
+                    self._mpy.soft_reset()
                 elif command == 'follow':
                     self.cmd_follow()
                     break